@@ -1,8 +1,9 @@
 from flask.json    import JSONEncoder
-from flask         import Flask
 from flask_cors    import CORS
 
 from view import create_endpoints
+from utils.logger import set_queue_logging
+from utils.json_response import ORJSONFlask
 
 #admin
 from model import OrderDao, OrderDetailDao, EnquiryDao
@@ -70,7 +71,9 @@ class Services:
 
 
 def create_app(test_config=None):
-    app = Flask(__name__)
+    set_queue_logging()
+
+    app = ORJSONFlask(__name__)
     app.debug = True
     app.json_encoder = CustomJSONEncoder
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
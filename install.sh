@@ -1 +1,3 @@
-pip install -r requirements.txt
\ No newline at end of file
+# mysqlclient 빌드에 MySQL 클라이언트 개발 헤더가 필요하다.
+# (Debian/Ubuntu: default-libmysqlclient-dev, Red Hat/CentOS: mysql-devel, README 의 설치 방법 참고)
+pip install -r requirements.txt
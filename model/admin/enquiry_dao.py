@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 from utils.custom_exceptions import EnquiryDoesNotExist, AnswerCreateFail
 
 
@@ -143,7 +143,7 @@ class EnquiryDao:
         total_count_sql += extra_sql
         sql += ' ORDER BY enquiry.id DESC LIMIT %(page)s, %(length)s;'
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             enquiries = cursor.fetchall()
             if not enquiries:
@@ -189,7 +189,7 @@ class EnquiryDao:
                     AND enquiry.id = %(enquiry_id)s;                    
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             answer = cursor.fetchone()
             if not answer:
@@ -222,7 +222,7 @@ class EnquiryDao:
                 )
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(validate_sql, data)
             validate = cursor.fetchone()
             if validate['validate']:
@@ -255,7 +255,7 @@ class EnquiryDao:
                         enquiry_id = %(enquiry_id)s
                 """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(validate_sql, data)
             validate = cursor.fetchone()
             if not validate['validate']:
@@ -284,7 +284,7 @@ class EnquiryDao:
                         enquiry_id = %(enquiry_id)s
                 """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(validate_sql, data)
             validate = cursor.fetchone()
             if not validate['validate']:
@@ -312,7 +312,7 @@ class EnquiryDao:
                                 id = %(enquiry_id)s
                         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(validate_sql, data)
             validate = cursor.fetchone()
             if not validate['validate']:
@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 from utils.custom_exceptions import (
     EventDoesNotExist,
     CategoryMenuDoesNotMatch,
@@ -136,7 +136,7 @@ class EventDao:
         total_count_sql += extra_sql
         sql += ' ORDER BY `event`.id DESC LIMIT %(page)s, %(length)s;'
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             events = cursor.fetchall()
             if not events:
@@ -197,7 +197,7 @@ class EventDao:
                 AND `event`.id = %(event_id)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             event = cursor.fetchone()
             if not event:
@@ -255,7 +255,7 @@ class EventDao:
                 order_index;   
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             buttons = cursor.fetchall()
 
@@ -337,7 +337,7 @@ class EventDao:
                 event_product.id DESC;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             products = cursor.fetchall()
 
@@ -367,7 +367,7 @@ class EventDao:
                 AND is_deleted = 0;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             count = cursor.fetchone()
 
@@ -484,7 +484,7 @@ class EventDao:
 
         sql += ' ORDER BY product.id DESC LIMIT %(page)s, %(length)s;'
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             products = cursor.fetchall()
             if not products:
@@ -639,13 +639,13 @@ class EventDao:
                 WHERE
                     main_category_id = %(first_category_id)s;
             """
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(validate_sql, data)
                 result = cursor.fetchone()
                 if not result:
                     raise CategoryMenuDoesNotMatch('category and menu does not match')
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             result = cursor.fetchall()
             if not result:
@@ -690,7 +690,7 @@ class EventDao:
                 , %(is_display)s);
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             result = cursor.lastrowid
             if not result:
@@ -755,7 +755,7 @@ class EventDao:
                 , %(event_id)s)
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(duplicate_check_sql, data)
             duplicate_check = cursor.fetchone()
             if duplicate_check['duplicate_button']:
@@ -837,7 +837,7 @@ class EventDao:
                 , %(button_id)s);
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(duplicate_check_sql, data)
             duplicate_check = cursor.fetchone()
             if duplicate_check['duplicate_event_product']:
@@ -913,7 +913,7 @@ class EventDao:
                 , %(product_id)s);
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(duplicate_check_sql, data)
             duplicate_check = cursor.fetchone()
             if duplicate_check['duplicate_event_product']:
@@ -958,7 +958,7 @@ class EventDao:
                 event_id = %(event_id)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
 
     def delete_event_products_by_event(self, connection, data):
@@ -983,7 +983,7 @@ class EventDao:
                 event_id = %(event_id)s
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
 
     def delete_event(self, connection, data):
@@ -1008,7 +1008,7 @@ class EventDao:
                 id = %(event_id)s 
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
 
     def update_event_detail(self, connection, data):
@@ -1043,7 +1043,7 @@ class EventDao:
 
         sql += 'WHERE id = %(event_id)s;'
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
 
     def get_event_kind_id(self, connection, event_id):
@@ -1059,14 +1059,14 @@ class EventDao:
             History:
                 2021-01-04(강두연): 작성
         """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute("""
                 SELECT 
                     event_kind_id
                 FROM 
                     `events`
                 WHERE id = %s;
-            """, event_id)
+            """, (event_id,))
             event_kind = cursor.fetchone()
 
             return event_kind['event_kind_id']
@@ -1097,7 +1097,7 @@ class EventDao:
                 AND id = %(id)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, button)
 
     def delete_event_button(self, connection, button):
@@ -1123,7 +1123,7 @@ class EventDao:
                 id = %s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, button)
 
     def move_button_products(self, connection, product):
@@ -1151,7 +1151,7 @@ class EventDao:
                 AND is_deleted = 0;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, product)
 
     def delete_event_product(self, connection, product):
@@ -1177,5 +1177,5 @@ class EventDao:
                 AND event_id = %(event_id)s
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, product)
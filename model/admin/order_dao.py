@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 import pandas as pd
 from utils.custom_exceptions import (OrderDoesNotExist,
                                      UnableToUpdate,
@@ -163,7 +163,7 @@ class OrderDao:
         elif not data['ids']:
             excel_sql += " LIMIT 0, 1000;"
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             # 엑셀 API 인 경우
             if 'ids' in data:
                 cursor.execute(excel_sql, data)
@@ -197,7 +197,7 @@ class OrderDao:
             WHERE id IN %(ids)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             affected_row = cursor.execute(sql, data)
             if affected_row != data['count_new_status']:
                 raise UnableToUpdate('업데이트가 불가합니다.')
@@ -219,7 +219,7 @@ class OrderDao:
             VALUES (%s, %s, %s);
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             created_rows = cursor.executemany(sql, data['update_data'])
             if created_rows != data['count_new_status']:
                 raise UnableToUpdate('업데이트가 불가합니다.')
@@ -276,8 +276,8 @@ class OrderDetailDao():
             WHERE order_item.id = %s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, order_item_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (order_item_id,))
             result = cursor.fetchone()
 
             if not result:
@@ -326,8 +326,8 @@ class OrderDetailDao():
             WHERE order_item.id = %s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, order_item_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (order_item_id,))
             result = cursor.fetchone()
             if not result:
                 raise DoesNotOrderDetail('주문 상세 정보가 존재하지 않습니다.')
@@ -377,8 +377,8 @@ class OrderDetailDao():
             WHERE order_item.id = %s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, order_item_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (order_item_id,))
             result = cursor.fetchone()
             if not result:
                 raise DoesNotOrderDetail('주문 상세 정보가 존재하지 않습니다.')
@@ -427,8 +427,8 @@ class OrderDetailDao():
             WHERE order_item.id = %s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, order_item_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (order_item_id,))
             result = cursor.fetchone()
             if not result:
                 raise DoesNotOrderDetail('주문 상세 정보가 존재하지 않습니다.')
@@ -461,8 +461,8 @@ class OrderDetailDao():
             ORDER BY order_item_history.id DESC;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, order_item_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (order_item_id,))
             result = cursor.fetchall()
             if not result:
                 raise DoesNotOrderDetail('주문 상세 정보가 존재하지 않습니다.')
@@ -491,7 +491,7 @@ class OrderDetailDao():
         """
 
         with connection.cursor() as cursor:
-            cursor.execute(sql, order_item_id)
+            cursor.execute(sql, (order_item_id,))
             result = cursor.fetchone()
             return result
 
@@ -514,7 +514,7 @@ class OrderDetailDao():
             WHERE order_items.id = %(order_item_id)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             affect_row = cursor.execute(sql, data)
             if affect_row == 0:
                 raise DeniedUpdate('업데이트가 실행되지 않았습니다.')
@@ -539,7 +539,7 @@ class OrderDetailDao():
             WHERE order_items.id = %(order_item_id)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             affect_row = cursor.execute(sql, data)
             if affect_row == 0:
                 raise DeniedUpdate('업데이트가 실행되지 않았습니다.')
@@ -562,7 +562,7 @@ class OrderDetailDao():
         WHERE order_items.id = %(order_item_id)s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             affect_row = cursor.execute(sql, data)
             if affect_row == 0:
                 raise DeniedUpdate('업데이트가 실행되지 않았습니다.')
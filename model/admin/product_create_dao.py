@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import (
     ProductCreateDenied,
@@ -16,6 +16,126 @@ from utils.custom_exceptions import (
 )
 
 
+_INSERT_PRODUCT_SQL = """
+    INSERT INTO products (
+        `is_display`
+        ,`is_sale`
+        ,`main_category_id`
+        ,`sub_category_id`
+        ,`is_product_notice`
+        ,`manufacturer`
+        ,`manufacturing_date`
+        ,`product_origin_type_id`
+        ,`name`
+        ,`description`
+        ,`detail_information`
+        ,`origin_price`
+        ,`discount_rate`
+        ,`discounted_price`
+        ,`discount_start_date`
+        ,`discount_end_date`
+        ,`minimum_quantity`
+        ,`maximum_quantity`
+        ,`seller_id`
+        ,`account_id`
+    ) VALUES (
+        %(is_display)s
+        ,%(is_sale)s
+        ,%(main_category_id)s
+        ,%(sub_category_id)s
+        ,%(is_product_notice)s
+        ,%(manufacturer)s
+        ,%(manufacturing_date)s
+        ,%(product_origin_type_id)s
+        ,%(product_name)s
+        ,%(description)s
+        ,%(detail_information)s
+        ,%(origin_price)s
+        ,%(discount_rate)s
+        ,%(discounted_price)s
+        ,%(discount_start_date)s
+        ,%(discount_end_date)s
+        ,%(minimum_quantity)s
+        ,%(maximum_quantity)s
+        ,%(seller_id)s
+        ,%(account_id)s
+    );
+    """
+
+_UPDATE_PRODUCT_CODE_SQL = """
+    UPDATE
+        products
+    SET
+        `product_code` = %(product_code)s
+    WHERE
+        id = %(product_id)s
+    AND
+        is_deleted = 0;
+    """
+
+_INSERT_PRODUCT_HISTORY_SQL = """
+    INSERT INTO product_histories (
+        `product_id`
+        ,`product_name`
+        ,`is_display`
+        ,`is_sale`
+        ,`origin_price`
+        ,`discounted_price`
+        ,`discount_rate`
+        ,`discount_start_date`
+        ,`discount_end_date`
+        ,`minimum_quantity`
+        ,`maximum_quantity`
+        ,`updater_id`
+    )
+    SELECT
+        `id`
+        ,`name`
+        ,`is_display`
+        ,`is_sale`
+        ,`origin_price`
+        ,`discounted_price`
+        ,`discount_rate`
+        ,`discount_start_date`
+        ,`discount_end_date`
+        ,`minimum_quantity`
+        ,`maximum_quantity`
+        ,%(account_id)s
+    FROM
+        products
+    WHERE
+        id = %(product_id)s;
+    """
+
+_INSERT_PRODUCT_IMAGES_SQL = """
+    INSERT INTO product_images(
+        `image_url`
+        , `product_id`
+        , `order_index`
+    ) VALUES {values};
+    """
+
+_PRODUCT_IMAGE_VALUES_SQL = "(%s, %s, %s)"
+
+_INSERT_STOCKS_SQL = """
+    INSERT INTO stocks(
+         `product_option_code`
+        , `is_stock_manage`
+        , `remain`
+        , `color_id`
+        , `size_id`
+        , `product_id`
+    ) VALUES (
+        %(product_option_code)s
+        ,%(is_stock_manage)s
+        ,%(remain)s
+        ,%(color_id)s
+        ,%(size_id)s
+        ,%(product_id)s
+    );
+    """
+
+
 class ProductCreateDao:
     """ Persistence Layer
 
@@ -29,16 +149,19 @@ class ProductCreateDao:
     """
     
     def insert_product(self, connection, data):
-        """ 상품 정보 등록 (상품 정보 테이블)
+        """ 상품 정보 등록 (상품 정보 테이블, 상품 코드 갱신, 상품 이력 정보 테이블)
         
         Args:
             connection: 데이터베이스 연결 객체
-            data      : 서비스 레이어에서 넘겨 받은 products 테이블 등록에 사용될 데이터
+            data      : 서비스 레이어에서 넘겨 받은 products, product_histories 테이블 등록에 사용될 데이터
         
         Author: 심원두
         
         Returns:
-            product_id : products 테이블에 신규 등록된 id 값
+            {
+                'product_id'   : products 테이블에 신규 등록된 id 값,
+                'product_code' : 신규 등록된 상품의 상품 코드
+            }
         
         History:
             2020-12-29(심원두): 초기 생성
@@ -47,122 +170,56 @@ class ProductCreateDao:
         Raises:
             500, {'message': 'product create denied',
                   'errorMessage': 'unable_to_create_product'} : 상품 정보 등록 실패
-        """
+            
+            500, {'message': 'product code update denied',
+                  'errorMessage': 'unable_to_update_product_code'} : 상품 코드 갱신 실패
+            
+            500, {'message': 'product history create denied',
+                  'errorMessage': 'unable_to_create_product_history'} : 상품 이력 정보 등록 실패
         
-        sql = """
-        INSERT INTO products (
-            `is_display`
-            ,`is_sale`
-            ,`main_category_id`
-            ,`sub_category_id`
-            ,`is_product_notice`
-            ,`manufacturer`
-            ,`manufacturing_date`
-            ,`product_origin_type_id`
-            ,`name`
-            ,`description`
-            ,`detail_information`
-            ,`origin_price`
-            ,`discount_rate`
-            ,`discounted_price`
-            ,`discount_start_date`
-            ,`discount_end_date`
-            ,`minimum_quantity`
-            ,`maximum_quantity`
-            ,`seller_id`
-            ,`account_id`
-        ) VALUES (
-            %(is_display)s
-            ,%(is_sale)s
-            ,%(main_category_id)s
-            ,%(sub_category_id)s
-            ,%(is_product_notice)s
-            ,%(manufacturer)s
-            ,%(manufacturing_date)s
-            ,%(product_origin_type_id)s
-            ,%(product_name)s
-            ,%(description)s
-            ,%(detail_information)s
-            ,%(origin_price)s
-            ,%(discount_rate)s
-            ,%(discounted_price)s
-            ,%(discount_start_date)s
-            ,%(discount_end_date)s
-            ,%(minimum_quantity)s
-            ,%(maximum_quantity)s
-            ,%(seller_id)s
-            ,%(account_id)s
-        );
+        Notes:
+            product_code 는 AUTO_INCREMENT 로 생성된 id 를 이용해 'P' + 18자리 id 로 생성한다.
+            상품 이력은 INSERT ... SELECT 로 등록된 상품 정보를 복사해 생성한다.
         """
         
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
-                product_id = cursor.lastrowid
+                cursor.execute(_INSERT_PRODUCT_SQL, data)
                 
-                if not product_id:
+                if not cursor.lastrowid:
                     raise ProductCreateDenied('unable_to_create_product')
                 
-                return product_id
-        
-        except Exception as e:
-            raise e
-    
-    def update_product_code(self, connection, data):
-        """ 상품 정보 갱신 (product_code 갱신)
-            
-            Args:
-                connection: 데이터베이스 연결 객체
-                data      : 서비스 레이어에서 넘겨 받은 products 테이블 갱신에 사용될 데이터
-            
-            Author: 심원두
-            
-            Returns:
-                0 : products 테이블 갱신 실패
-                1 : products 테이블 갱신 성공 (product_code)
-            
-            History:
-                2020-12-29(심원두): 초기 생성
-                2020-12-31(심원두): Docstring 수정
-            
-            Raises:
-                500, {'message': 'product code update denied',
-                      'errorMessage': 'unable_to_update_product_code'} : 상품 코드 갱신 실패
-        """
-        
-        sql = """
-            UPDATE
-                products
-            SET
-                `product_code` = %(product_code)s
-            WHERE
-                id = %(product_id)s
-            AND
-                is_deleted = 0;
-        """
-        
-        try:
-            with connection.cursor() as cursor:
-                result = cursor.execute(sql, data)
+                result = {
+                    'product_id'   : cursor.lastrowid,
+                    'product_code' : 'P' + str(cursor.lastrowid).zfill(18),
+                    'account_id'   : data['account_id']
+                }
                 
-                if not result:
+                if not cursor.execute(_UPDATE_PRODUCT_CODE_SQL, result):
                     raise ProductCodeUpdatedDenied('unable_to_update_product_code')
+                
+                if not cursor.execute(_INSERT_PRODUCT_HISTORY_SQL, result):
+                    raise ProductHistoryCreateDenied('unable_to_create_product_history')
+                
+                return {
+                    'product_id'   : result['product_id'],
+                    'product_code' : result['product_code']
+                }
         
         except Exception as e:
             raise e
     
-    def insert_product_image(self, connection, data):
-        """ 상품 이미지 정보 등록
+    def insert_product_images(self, connection, rows):
+        """ 상품 이미지 정보 일괄 등록
             
             Args:
                 connection: 데이터베이스 연결 객체
-                data      : 서비스 레이어에서 넘겨 받은 product_images 테이블 등록에 사용될 데이터
+                rows      : 서비스 레이어에서 넘겨 받은 product_images 테이블 등록에 사용될 데이터 리스트
 
             Author: 심원두
 
             Returns:
-                0 : products_images 테이블 데이터 생성 실패
-                1 : products_images 테이블 데이터 생성 성공
+                [1, 2, 3] : product_images 테이블에 등록된 id 리스트 (order_index 순서)
 
             History:
                 2020-12-29(심원두): 초기 생성
@@ -171,45 +228,40 @@ class ProductCreateDao:
             Raises:
                 500, {'message': 'product image create denied',
                       'errorMessage': 'unable_to_create_product_image'} : 상품 이미지 정보 등록 실패
-        """
-        
-        sql = """
-        INSERT INTO product_images(
-            `image_url`
-            , `product_id`
-            , `order_index`
-        ) VALUES (
-            %(image_url)s
-            ,%(product_id)s
-            ,%(order_index)s
-        );
+            
+            Notes:
+                executemany 는 쿼리가 cursor 의 max_stmt_length(mysqlclient 기본값 64KiB)를 넘으면 여러 INSERT 로
+                나뉘어 lastrowid 가 마지막 INSERT 의 첫 번째 id 가 되므로, 하나의 multi-row INSERT 를 직접 만들어 실행한다.
+                multi-row INSERT 의 lastrowid 는 첫 번째 row 의 id 이고, innodb_autoinc_lock_mode 가
+                0 또는 1(MySQL 5.7 기본값)인 경우 나머지 id 는 연속으로 할당되므로 id 리스트를 계산할 수 있다.
         """
         
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
-                result = cursor.lastrowid
+                sql = _INSERT_PRODUCT_IMAGES_SQL.format(values=', '.join([_PRODUCT_IMAGE_VALUES_SQL] * len(rows)))
+                args = tuple(value for row in rows for value in (row['image_url'], row['product_id'], row['order_index']))
                 
-                if not result:
+                result = cursor.execute(sql, args)
+                
+                if result != len(rows):
                     raise ProductImageCreateDenied('unable_to_create_product_image')
                 
-                return result
+                return list(range(cursor.lastrowid, cursor.lastrowid + result))
         
         except Exception as e:
             raise e
     
-    def insert_stock(self, connection, data):
-        """ 상품 옵션 정보 등록
+    def insert_stocks(self, connection, rows):
+        """ 상품 옵션 정보 일괄 등록
 
             Args:
                 connection: 데이터베이스 연결 객체
-                data      : 서비스 레이어에서 넘겨 받은 상품 옵션 정보 이미지 등록에 사용될 데이터
+                rows      : 서비스 레이어에서 넘겨 받은 stocks 테이블 등록에 사용될 데이터 리스트
 
             Author: 심원두
 
             Returns:
-                0 : stocks 테이블 데이터 생성 실패
-                1 : stocks 테이블 데이터 생성 성공
+                result : stocks 테이블에 등록된 row 수
 
             History:
                 2020-12-29(심원두): 초기 생성
@@ -217,32 +269,15 @@ class ProductCreateDao:
 
             Raises:
                 500, {'message': 'stock create denied',
-                      'errorMessage': 'unable_to_create_stocks'}: 상품 이미지 정보 등록 실패
-        """
-        
-        sql = """
-            INSERT INTO stocks(
-                 `product_option_code`
-                , `is_stock_manage`
-                , `remain`
-                , `color_id`
-                , `size_id`
-                , `product_id`
-            ) VALUES (
-                %(product_option_code)s
-                ,%(is_stock_manage)s
-                ,%(remain)s
-                ,%(color_id)s
-                ,%(size_id)s
-                ,%(product_id)s
-            );
+                      'errorMessage': 'unable_to_create_stocks'}: 상품 옵션 정보 등록 실패
         """
         
         try:
             with connection.cursor() as cursor:
-                result = cursor.execute(sql, data)
+                cursor.executemany(_INSERT_STOCKS_SQL, rows)
+                result = cursor.rowcount
                 
-                if not result:
+                if result != len(rows):
                     raise StockCreateDenied('unable_to_create_stocks')
                 
                 return result
@@ -250,70 +285,6 @@ class ProductCreateDao:
         except Exception as e:
             raise e
     
-    def insert_product_history(self, connection, data):
-        """ 상품 이력 정보 등록
-            
-            Args:
-                connection: 데이터베이스 연결 객체
-                data      : 서비스 레이어에서 넘겨 받은 상품 옵션 정보 이미지 등록에 사용될 데이터
-            
-            Author: 심원두
-            
-            Returns:
-                0 : product_histories 테이블 데이터 생성 실패
-                1 : product_histories 테이블 데이터 생성 성공
-            
-            History:
-                2020-12-29(심원두): 초기 생성
-                2020-12-31(심원두): Docstring 수정
-            
-            Raises:
-                500, {'message': 'product history create denied',
-                      'errorMessage': 'unable_to_create_product_history'} : 상품 이미지 정보 등록 실패
-        """
-        
-        sql = """
-            INSERT INTO product_histories (
-                `product_id`
-                ,`product_name`
-                ,`is_display`
-                ,`is_sale`
-                ,`origin_price`
-                ,`discounted_price`
-                ,`discount_rate`
-                ,`discount_start_date`
-                ,`discount_end_date`
-                ,`minimum_quantity`
-                ,`maximum_quantity`
-                ,`updater_id`
-            ) VALUES (
-                %(product_id)s
-                ,%(product_name)s
-                ,%(is_display)s
-                ,%(is_sale)s
-                ,%(origin_price)s
-                ,%(discounted_price)s
-                ,%(discount_rate)s
-                ,%(discount_start_date)s
-                ,%(discount_end_date)s
-                ,%(minimum_quantity)s
-                ,%(maximum_quantity)s
-                ,%(account_id)s
-            );
-        """
-        
-        try:
-            with connection.cursor() as cursor:
-                result = cursor.execute(sql, data)
-    
-                if not result:
-                    raise ProductHistoryCreateDenied('unable_to_create_product_history')
-                
-                return result
-        
-        except Exception as e:
-            raise e
-    
     def insert_product_sales_volumes(self, connection, product_id):
         """ 상품 판매량 정보 초기 등록
             
@@ -346,7 +317,7 @@ class ProductCreateDao:
         
         try:
             with connection.cursor() as cursor:
-                result = cursor.execute(sql, product_id)
+                result = cursor.execute(sql, (product_id,))
                 
                 if not result:
                     raise ProductSalesVolumeCreateDenied('unable_to_create_product_sales_volumes')
@@ -367,7 +338,7 @@ class ProductCreateDao:
         
         try:
             with connection.cursor() as cursor:
-                result = cursor.execute(sql, product_id)
+                result = cursor.execute(sql, (product_id,))
                 
                 if not result:
                     raise ProductBookMarkVolumeCreateDenied('unable_to_create_bookmark_volumes')
@@ -409,7 +380,7 @@ class ProductCreateDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 
@@ -454,7 +425,7 @@ class ProductCreateDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
     
@@ -499,7 +470,7 @@ class ProductCreateDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 
@@ -544,7 +515,7 @@ class ProductCreateDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
@@ -585,7 +556,7 @@ class ProductCreateDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 if not result:
@@ -631,7 +602,7 @@ class ProductCreateDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 
@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import (
     ProductNotExist,
@@ -124,7 +124,7 @@ class ProductManageDao:
         """
         sql += self.__generate_where_sql(data)
         
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             result = cursor.fetchone()
             return result
@@ -182,7 +182,7 @@ class ProductManageDao:
         
         sql += order_by + limit
         
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             result = cursor.fetchall()
             return result
@@ -251,7 +251,7 @@ class ProductManageDao:
             AND product.`product_code` = %(product_code)s
         """
         
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             result = cursor.fetchone()
             
@@ -296,7 +296,7 @@ class ProductManageDao:
         
         try:
             
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 
@@ -352,7 +352,7 @@ class ProductManageDao:
         """
         
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 
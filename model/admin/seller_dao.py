@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 from datetime                import datetime
 
 from utils.custom_exceptions import (
@@ -19,8 +19,8 @@ class SellerDao:
             FROM accounts
             WHERE username = %s;
         """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, data['username'])
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (data['username'],))
             result = cursor.fetchall()
             return result
 
@@ -106,7 +106,7 @@ class SellerDao:
             AND username = %(username)s
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             result = cursor.fetchone()
             return result
@@ -192,7 +192,7 @@ class SellerDao:
         sql += extra_sql + filter_sql
         total_count_sql += extra_sql
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             sellers = cursor.fetchall()
             if not sellers:
@@ -232,8 +232,8 @@ class SellerDao:
             ORDER BY account.id DESC 
             LIMIT 0, %s
         """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, offset)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (offset,))
             sellers = cursor.fetchall()
             if not sellers:
                 raise SellerNotExist('seller does not exist')
@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import (
     SellerNotExist,
@@ -59,8 +59,8 @@ class SellerInfoDao:
         # INNER JOIN additional_contacts AS `additional_contact`
         #     ON seller.account_id = `additional_contact`.seller_id
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, account_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (account_id,))
             result = cursor.fetchall()
             if not result:
                 raise SellerNotExist('seller_does_not_exist')
@@ -96,7 +96,7 @@ class SellerInfoDao:
             is_deleted = 0 			# 고정 값
             AND sellers.account_id = %(account_id)s;	
         """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, data)
             if result == 0:
                 raise SellerUpdateDenied('unable_to_update')
@@ -117,7 +117,7 @@ class SellerInfoDao:
             is_deleted = 0 			# 고정 값
             AND sellers.account_id = %(account_id)s;	
         """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, data)
             if result == 0:
                 raise SellerUpdateDenied('unable_to_update')
@@ -156,8 +156,8 @@ class SellerInfoDao:
         """
         # ORDER BY
         #     order_index ASC;
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, account_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (account_id,))
             result = cursor.fetchall()
             if not result:
                 raise SellerNotExist('seller_does_not_exist')
@@ -194,7 +194,7 @@ class SellerInfoDao:
          """
         print(add_contact)
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, add_contact)
             if result == 0:
                 raise SellerUpdateDenied('unable_to_update')
@@ -215,7 +215,7 @@ class SellerInfoDao:
                 is_deleted = 0 			# 고정 값
                 AND sellers.account_id = %(account_id)s;	
             """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, data)
             if result == 0:
                 raise SellerNotExist('unable_to_update')
@@ -245,8 +245,8 @@ class SellerInfoDao:
         """
         #        ORDER BY
         #            `history`.id DESC;
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, account_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (account_id,))
             result = cursor.fetchall()
             if not result:
                 raise SellerNotExist('seller_does_not_exist')
@@ -269,7 +269,7 @@ class SellerInfoDao:
                 %(seller_status_type_id)s,
                 %(updater_id)s);
         """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, data)
             if result == 0:
                 raise SellerUpdateDenied('unable_to_update')
@@ -290,7 +290,7 @@ class SellerInfoDao:
                 is_deleted = 0 			# 고정 값
                 AND accounts.id = %(account_id)s;	
             """
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, data)
             if result == 0:
                 raise SellerNotExist('unable_to_update')
@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 from utils.custom_exceptions import UserUpdateDenied, UserCreateDenied, UserNotExist
 
 
@@ -43,8 +43,8 @@ class SampleUserDao:
             WHERE id=%s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, user_id)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (user_id,))
             result = cursor.fetchall()
             if not result:
                 raise UserNotExist('user_does_not_exist')
@@ -78,8 +78,8 @@ class SampleUserDao:
             WHERE name = %s;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, data['name'])
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (data['name'],))
             result = cursor.fetchall()
             return result
 
@@ -110,8 +110,8 @@ class SampleUserDao:
     #         WHERE name = %s;
     #     """
     #
-    #     with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-    #         cursor.execute(sql, data['name'])
+    #     with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+    #         cursor.execute(sql, (data['name'],))
     #         result = cursor.fetchall()
     #         return result
 
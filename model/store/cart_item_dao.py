@@ -1,5 +1,5 @@
 import traceback
-import pymysql
+import MySQLdb.cursors
 from utils.custom_exceptions import (
     CartItemNotExist,
     CartItemCreateDenied,
@@ -87,8 +87,8 @@ class CartItemDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data['cart_id'])
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (data['cart_id'],))
                 item_info = cursor.fetchone()
                 if not item_info:
                     raise CartItemNotExist('cart_item_does_not_exist')
@@ -146,8 +146,8 @@ class CartItemDao:
         ;
         """
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data['product_id'])
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (data['product_id'],))
                 result = cursor.fetchone()
                 if not result:
                     raise ProductNotExist('product_does_not_exist')
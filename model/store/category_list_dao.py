@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import DatabaseError
 
@@ -51,7 +51,7 @@ class CategoryListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 return result
@@ -97,7 +97,7 @@ class CategoryListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 return result
@@ -143,7 +143,7 @@ class CategoryListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 return result
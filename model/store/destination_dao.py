@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import DeleteDenied, DestinationNotExist, DestinationCreateDenied, AccountNotExist, UpdateDenied
 
@@ -119,8 +119,8 @@ class DestinationDao:
                 ;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, data)
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (data,))
             result = cursor.fetchall()
             if not result:
                 raise DestinationNotExist('배송지 정보가 존재하지 않습니다.')
@@ -163,8 +163,8 @@ class DestinationDao:
                 ;
         """
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, data['destination_id'])
+        with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (data['destination_id'],))
             result = cursor.fetchall()
             if not result:
                 raise DestinationNotExist('배송지 정보가 존재하지 않습니다.')
@@ -287,7 +287,7 @@ class DestinationDao:
         """
 
         with connection.cursor() as cursor:
-            cursor.execute(sql, account_id)
+            cursor.execute(sql, (account_id,))
             default_location = cursor.fetchone()
 
             # 튜플 형식을 반환해준다: 기본배송지가 존재하지 않을경우 None 을 반환한다.
@@ -323,7 +323,7 @@ class DestinationDao:
         """
 
         with connection.cursor() as cursor:
-            cursor.execute(sql, account_id)
+            cursor.execute(sql, (account_id,))
             counts = cursor.fetchone()
 
             return counts[0]
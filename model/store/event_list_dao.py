@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import DatabaseError
 
@@ -60,7 +60,7 @@ class EventListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
@@ -124,8 +124,8 @@ class EventListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, event_id)
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (event_id,))
                 result = cursor.fetchone()
                 return result
 
@@ -173,8 +173,8 @@ class EventListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, event_id)
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (event_id,))
                 result = cursor.fetchall()
                 return result
 
@@ -219,8 +219,8 @@ class EventListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, event_id)
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (event_id,))
                 result = cursor.fetchone()
                 return result['is_button']
 
@@ -290,7 +290,7 @@ class EventListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
@@ -359,7 +359,7 @@ class EventListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
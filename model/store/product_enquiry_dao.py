@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import DatabaseError
 
@@ -46,7 +46,7 @@ class ProductEnquiryDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 return result
@@ -117,7 +117,7 @@ class ProductEnquiryDao:
             LIMIT %(offset)s, %(limit)s
             '''
 
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
@@ -172,7 +172,7 @@ class ProductEnquiryDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = {row['enquiry_id']: row for row in cursor.fetchall()}
                 return result
@@ -248,7 +248,7 @@ class ProductEnquiryDao:
             LIMIT %(offset)s, %(limit)s
             """
 
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
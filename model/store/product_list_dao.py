@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import DatabaseError
 
@@ -82,7 +82,7 @@ class ProductListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 data['search'] = '%%' + data['search'] + '%%' 
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
@@ -156,7 +156,7 @@ class ProductListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
                 return result
@@ -203,7 +203,7 @@ class ProductListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchone()
                 return result
@@ -244,7 +244,7 @@ class ProductListDao:
 
         """
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 images = cursor.fetchall()
                 return images 
@@ -291,7 +291,7 @@ class ProductListDao:
             ;
         """
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 color = cursor.fetchall()
                 return color
@@ -339,7 +339,7 @@ class ProductListDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 sizes = cursor.fetchall()
                 return sizes
@@ -427,7 +427,7 @@ class ProductListDao:
                         ;
         """
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 if 'account_id' not in data:
                     sql += sql_without_account
                     cursor.execute(sql, data)
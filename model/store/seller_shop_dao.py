@@ -1,5 +1,5 @@
-import traceback
-import pymysql
+import logging
+import MySQLdb.cursors
 
 from utils.custom_exceptions import (
     SellerNotExist,
@@ -7,6 +7,8 @@ from utils.custom_exceptions import (
     SellerCategoryNotExist,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class SellerShopDao:
     """ Persistence Layer
@@ -61,19 +63,18 @@ class SellerShopDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, account_id)
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (account_id,))
                 result = cursor.fetchone()
                 if not result:
                     raise SellerNotExist('seller_not_exist')
                 return result
 
         except SellerNotExist as e:
-            traceback.print_exc()
             raise e
 
         except Exception:
-            traceback.print_exc()
+            logger.exception('셀러 정보 조회 실패')
             raise ServerError('server_error')
 
     def get_seller_product_search_dao(self, connection, data):
@@ -140,7 +141,7 @@ class SellerShopDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 data['keyword'] = "%"+data['keyword']+"%"
                 cursor.execute(sql, data)
                 results = cursor.fetchall()
@@ -151,7 +152,7 @@ class SellerShopDao:
                 return results
 
         except Exception:
-            traceback.print_exc()
+            logger.exception('셀러 상품 검색 실패')
             raise ServerError('server_error')
 
     def get_seller_category_dao(self, connection, data):
@@ -195,7 +196,7 @@ class SellerShopDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 result = cursor.fetchall()
 
@@ -205,11 +206,10 @@ class SellerShopDao:
                 return result
 
         except SellerCategoryNotExist as e:
-            traceback.print_exc()
             raise e
 
         except Exception:
-            traceback.print_exc()
+            logger.exception('셀러 카테고리 조회 실패')
             raise ServerError('server_error')
 
     def get_seller_product_list_dao(self, connection, data):
@@ -304,7 +304,7 @@ class SellerShopDao:
         ;
                 """
 
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 results = cursor.fetchall()
 
@@ -314,5 +314,5 @@ class SellerShopDao:
                 return results
 
         except Exception:
-            traceback.print_exc()
+            logger.exception('셀러 상품 리스트 조회 실패')
             raise ServerError('server_error')
@@ -1,6 +1,40 @@
-import traceback
-import pymysql
-from utils.custom_exceptions import ServerError
+import logging
+import threading
+import MySQLdb.cursors
+from cachetools import TTLCache
+from utils.custom_exceptions import ServerError, AccountNotExist
+
+logger = logging.getLogger(__name__)
+
+
+_SELECT_SENDER_AND_PERMISSION_SQL = """
+    SELECT
+    ci.name
+    , ci.phone
+    , ci.email
+    , a.permission_type_id
+    FROM accounts AS a
+    LEFT JOIN customer_information AS ci ON ci.account_id = a.id
+    WHERE a.id = %s
+    AND a.is_deleted = 0
+    ;
+    """
+
+# 주문자 정보 캐시 (account_id: 주문자 정보와 권한), 프로세스 단위로 60초간 유지된다.
+_sender_info_cache = TTLCache(maxsize=50000, ttl=60)
+_sender_info_cache_lock = threading.Lock()
+
+
+def delete_sender_info_cache(account_id):
+    """ 주문자 정보 캐시 삭제
+
+    customer_information 테이블을 변경하는 곳에서 호출해 캐시된 주문자 정보를 무효화한다.
+
+    Args:
+        account_id: 캐시를 삭제할 유저의 account_id
+    """
+    with _sender_info_cache_lock:
+        _sender_info_cache.pop(account_id, None)
 
 
 class SenderDao:
@@ -14,8 +48,10 @@ class SenderDao:
             2020-12-30(고수희): 초기 생성
     """
 
-    def get_sender_info_dao(self, connection, data):
-        """ 주문자 정보 조회
+    def get_sender_and_permission_dao(self, connection, data):
+        """ 주문자 정보와 사용자 권한 조회
+
+        accounts 와 customer_information 을 JOIN 해 한 번의 쿼리로 조회한다.
 
         Args:
             connection: 데이터베이스 연결 객체
@@ -27,9 +63,12 @@ class SenderDao:
             {"name": "고수희",
             "phone": "01012341234",
             "email": "gosuhee@gmail.com",
+            "permission_type_id": 3
             }
 
         Raises:
+            401 {"message": "account_does_not_exist",
+            "error_message: "account_does_not_exist"} 계정 정보 없음
             500 {"message": "server error",
             "error_message: "server_error"} 서버 에러
 
@@ -37,30 +76,36 @@ class SenderDao:
         History:
             2020-12-30(고수희): 초기 생성
             2020-01-02(고수희): traceback 추가
+
+        Notes:
+            주문자 정보가 없는 경우 name, phone, email 은 빈 문자열로 반환한다.
+            조회 결과는 account_id 별로 60초간 캐시되며,
+            주문자 정보가 변경되면 delete_sender_info_cache 로 무효화된다.
         """
-        sql = """
-        SELECT
-        name 
-        , phone 
-        , email 
-        FROM customer_information
-        WHERE account_id = %s
-        ;
-        """
+        with _sender_info_cache_lock:
+            result = _sender_info_cache.get(data['user_id'])
+
+        if result is not None:
+            return result
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data['user_id'])
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(_SELECT_SENDER_AND_PERMISSION_SQL, (data['user_id'],))
                 result = cursor.fetchone()
                 if not result:
-                    result = {
-                                "name":"",
-                                "phone":"",
-                                "email":""
-                    }
-                    return result
-                return result
+                    raise AccountNotExist('account_does_not_exist')
+
+                for key in ('name', 'phone', 'email'):
+                    if result[key] is None:
+                        result[key] = ""
+
+            with _sender_info_cache_lock:
+                _sender_info_cache[data['user_id']] = result
+            return result
+
+        except AccountNotExist as e:
+            raise e
 
         except Exception:
-            traceback.print_exc()
+            logger.exception('주문자 정보 조회 실패')
             raise ServerError('server_error')
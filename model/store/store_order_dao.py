@@ -1,5 +1,5 @@
 import traceback
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import (
     OrderNotExist,
@@ -57,8 +57,8 @@ class StoreOrderDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data['order_id'])
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (data['order_id'],))
                 result = cursor.fetchone()
                 if not result:
                     raise OrderNotExist('order_does_not_exist')
@@ -103,8 +103,8 @@ class StoreOrderDao:
         """
 
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data['product_id'])
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
+                cursor.execute(sql, (data['product_id'],))
                 result = cursor.fetchone()
                 if not result:
                     raise ProductNotExist('product_does_not_exist')
@@ -160,14 +160,14 @@ class StoreOrderDao:
           content
           ,is_default 
           ) VALUES (
-          %(delivery_content)s
+          %s
           ,0
           );
           """
 
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
+                cursor.execute(sql, (data['delivery_content'],))
                 result = cursor.lastrowid
                 if not result:
                     raise DeliveryMemoCreateDenied('unable_to_create')
@@ -220,23 +220,35 @@ class StoreOrderDao:
         VALUES (
         (CONCAT(DATE_FORMAT(now(), '%%Y%%m%%d'),
         (SELECT LPAD(count(*)+1,6,0)from orders as ord where date(created_at) = date(now())),(LPAD(0,3,0))))
-        , %(sender_name)s
-        , %(sender_phone)s
-        , %(sender_email)s
-        , %(recipient_name)s
-        , %(recipient_phone)s
-        , %(address1)s
-        , %(address2)s
-        , %(post_number)s
-        , %(user_id)s
-        , %(delivery_memo_type_id)s
-        , %(total_price)s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
+        , %s
         );
         """
 
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
+                cursor.execute(sql, (
+                    data['sender_name'],
+                    data['sender_phone'],
+                    data['sender_email'],
+                    data['recipient_name'],
+                    data['recipient_phone'],
+                    data['address1'],
+                    data['address2'],
+                    data['post_number'],
+                    data['user_id'],
+                    data['delivery_memo_type_id'],
+                    data['total_price'],
+                ))
                 result = cursor.lastrowid
                 if not result:
                     raise OrderCreateDenied('unable_to_create')
@@ -283,23 +295,34 @@ class StoreOrderDao:
               , discounted_price
               , sale
           ) VALUES (
-              %(product_id)s
-              , %(stock_id)s
-              , %(quantity)s
-              , %(order_id)s
-              , %(cart_id)s
+              %s
+              , %s
+              , %s
+              , %s
+              , %s
               , (CONCAT('B',
-              (select replace(order_number,"000","001") from orders where id = %(order_id)s)))
-              , %(order_item_status_type_id)s
-              , %(original_price)s
-              , %(discounted_price)s
-              , %(sale)s
+              (select replace(order_number,"000","001") from orders where id = %s)))
+              , %s
+              , %s
+              , %s
+              , %s
           );
           """
 
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
+                cursor.execute(sql, (
+                    data['product_id'],
+                    data['stock_id'],
+                    data['quantity'],
+                    data['order_id'],
+                    data['cart_id'],
+                    data['order_id'],
+                    data['order_item_status_type_id'],
+                    data['original_price'],
+                    data['discounted_price'],
+                    data['sale'],
+                ))
                 result = cursor.lastrowid
                 if not result:
                     raise OrderItemCreateDenied('unable_to_create')
@@ -340,15 +363,19 @@ class StoreOrderDao:
             , order_item_status_type_id
             , updater_id
         ) VALUES (
-            %(order_item_id)s
-            , %(order_item_status_type_id)s
-            , %(user_id)s
+            %s
+            , %s
+            , %s
         );
         """
 
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
+                cursor.execute(sql, (
+                    data['order_item_id'],
+                    data['order_item_status_type_id'],
+                    data['user_id'],
+                ))
                 result = cursor.lastrowid
                 if not result:
                     raise OrderHistoryCreateDenied('unable_to_create')
@@ -384,14 +411,14 @@ class StoreOrderDao:
 
         sql = """
         UPDATE stocks
-        SET  remain = remain - %(quantity)s
-        WHERE id = %(stock_id)s
+        SET  remain = remain - %s
+        WHERE id = %s
         ;
         """
 
         try:
             with connection.cursor() as cursor:
-                affected_row = cursor.execute(sql, data)
+                affected_row = cursor.execute(sql, (data['quantity'], data['stock_id']))
                 if affected_row == 0:
                     raise ProductRemainUpdateDenied('unable_to_update')
 
@@ -426,12 +453,12 @@ class StoreOrderDao:
         sql = """
         UPDATE cart_items
         SET is_deleted = 1
-        WHERE id = %(cart_id)s;
+        WHERE id = %s;
         """
 
         try:
             with connection.cursor() as cursor:
-                affected_row = cursor.execute(sql, data)
+                affected_row = cursor.execute(sql, (data['cart_id'],))
                 if affected_row == 0:
                     raise DeleteDenied('unable_to_delete')
 
@@ -471,21 +498,29 @@ class StoreOrderDao:
         , phone
         )
         VALUES (
-        %(user_id)s
-        , %(sender_name)s
-        , %(sender_email)s
-        , %(sender_phone)s
+        %s
+        , %s
+        , %s
+        , %s
         )
         ON DUPLICATE KEY UPDATE
-        name = %(sender_name)s
-        , email = %(sender_email)s
-        , phone = %(sender_phone)s
+        name = %s
+        , email = %s
+        , phone = %s
         ;
         """
 
         try:
             with connection.cursor() as cursor:
-                cursor.execute(sql, data)
+                cursor.execute(sql, (
+                    data['user_id'],
+                    data['sender_name'],
+                    data['sender_email'],
+                    data['sender_phone'],
+                    data['sender_name'],
+                    data['sender_email'],
+                    data['sender_phone'],
+                ))
 
         except Exception:
             traceback.print_exc()
@@ -1,4 +1,4 @@
-import pymysql
+import MySQLdb.cursors
 
 from utils.custom_exceptions import DatabaseError, DataManipulationFail
 
@@ -298,7 +298,7 @@ class UserDao:
                 AND username = %(username)s
                 """
 
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with connection.cursor(MySQLdb.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
                 return cursor.fetchone()
 
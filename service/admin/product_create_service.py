@@ -46,7 +46,10 @@ class ProductCreateService:
             Author: 심원두
             
             Returns:
-                product_id : 생성한 products 테이블의 키 값
+                {
+                    'product_id'   : 생성한 products 테이블의 키 값,
+                    'product_code' : 생성한 상품의 상품 코드
+                }
                 
             Raises:
                 400, {'message': 'key error',
@@ -79,6 +82,12 @@ class ProductCreateService:
                 500, {'message': 'product create denied',
                       'errorMessage': 'unable_to_create_product'}: 상품 정보 등록 실패
                 
+                500, {'message': 'product code update denied',
+                      'errorMessage': 'unable_to_update_product_code'}: 상품 코드 갱신 실패
+                
+                500, {'message': 'product history create denied',
+                      'errorMessage': 'unable_to_create_product_history'}: 상품 이력 등록 실패
+                
             History:
                 2020-12-29(심원두): 초기 생성
                 2020-12-30(심원두): 예외처리 구현
@@ -147,46 +156,6 @@ class ProductCreateService:
         except Exception as e:
             raise e
     
-    def update_product_code_service(self, connection, product_id):
-        """ 상품 코드(product_code) 생성 후 상품 코드 업데이트
-
-            Args:
-                connection : 데이터베이스 연결 객체
-                product_id : View 에서 상품정보 등록 성공 후 넘겨 받은 해당 상품 정보 테이블의 id
-
-            Author: 심원두
-            
-            Returns:
-                0: 상품 코드 갱신 실패
-                1: 상품 코드 갱신 성공
-
-            Raises:
-                400, {'message': 'key error',
-                      'errorMessage': 'key_error' + format(e)}: 잘못 입력된 키값
-
-                500, {'message': 'product code update denied',
-                      'errorMessage': 'unable_to_update_product_code'}: 상품 코드 갱신 실패
-            
-            History:
-                2020-12-29(심원두): 초기 생성
-        """
-        
-        try:
-            data = {
-                'product_code' : 'P' + str(product_id).zfill(18),
-                'product_id'   : product_id
-            }
-            
-            self.create_product_dao.update_product_code(connection, data)
-            
-            return data['product_code']
-            
-        except KeyError as e:
-            raise e
-        
-        except Exception as e:
-            raise e
-    
     def create_product_images_service(self, connection, seller_id, product_id, product_code, product_images):
         """ 상품 이미지 등록
             
@@ -199,8 +168,7 @@ class ProductCreateService:
             Author: 심원두
             
             Returns:
-                0: 상품 이미지 테이블 등록 실패
-                1: 상품 이미지 테이블 등록 성공
+                [1, 2, 3]: 상품 이미지 테이블에 등록된 id 리스트 (이미지 순서와 동일)
 
             Raises:
                 413, {'message': 'invalid file',
@@ -230,6 +198,7 @@ class ProductCreateService:
         
         try:
             image_buffer   = []
+            image_rows     = []
             
             for product_image in product_images:
                 if not product_image or not product_image.filename:
@@ -273,13 +242,16 @@ class ProductCreateService:
                     S3FileManager().file_delete(file_name)
                     raise FileUploadFailException('image file upload to amazon fail')
                 
-                data = {
+                image_rows.append({
                     'image_url'  : url,
                     'product_id' : product_id,
                     'order_index': index + 1
-                }
-                
-                self.create_product_dao.insert_product_image(connection, data)
+                })
+            
+            if not image_rows:
+                return []
+            
+            return self.create_product_dao.insert_product_images(connection, image_rows)
         
         except Exception as e:
             raise e
@@ -311,7 +283,7 @@ class ProductCreateService:
         """
         
         try:
-            data = {}
+            stock_rows = []
             
             for stock in stocks:
                 product_option_code = \
@@ -319,11 +291,13 @@ class ProductCreateService:
                     str(stock['color']).zfill(3) + \
                     str(stock['size']).zfill(3)
                 
-                data['product_option_code'] = product_option_code
-                data['product_id']          = product_id
-                data['color_id']            = stock['color']
-                data['size_id']             = stock['size']
-                data['remain']              = stock['remain']
+                data = {
+                    'product_option_code' : product_option_code,
+                    'product_id'          : product_id,
+                    'color_id'            : stock['color'],
+                    'size_id'             : stock['size'],
+                    'remain'              : stock['remain']
+                }
                 
                 if not stock['isStockManage']:
                     stock['isStockManage'] = 0
@@ -333,53 +307,10 @@ class ProductCreateService:
                 if not stock['remain']:
                     data['remain'] = 0
                 
-                self.create_product_dao.insert_stock(connection, data)
-        
-        except KeyError as e:
-            raise e
-        
-        except Exception as e:
-            raise e
-    
-    def create_product_history_service(self, connection, product_id, data):
-        """ 상품 이력 정보 등록
-
-            Args:
-                connection : 데이터베이스 연결 객체
-                product_id : View 에서 상품정보 등록 성공 후 넘겨 받은 상품 정보 테이블의 id
-                data       : View 에서 넘겨 받은 상품 정보
-
-            Author: 심원두
-
-            Returns:
-                0: 상품 이력 정보 등록 실패
-                1: 상품 이력 정보 등록 성공
-            
-            Raises:
-                400, {'message': 'key error',
-                      'errorMessage': 'key_error' + format(e)}: 잘못 입력된 키값
-
-                500, {'message': 'product history create denied',
-                      'errorMessage': 'unable_to_create_product_history'}: 상품 이력 등록 실패
-            
-            History:
-                2020-12-29(심원두): 초기 생성
-        """
-        
-        try:
-            data['product_id']    = product_id
-            data['discount_rate'] = float(data['discount_rate'])/100
-            
-            if not data['discount_start_date']:
-                data['discount_start_date'] = None
-            
-            if not data['discount_end_date']:
-                data['discount_end_date'] = None
-            
-            if not data['discounted_price']:
-                data['discounted_price'] = None
+                stock_rows.append(data)
             
-            self.create_product_dao.insert_product_history(connection, data)
+            if stock_rows:
+                self.create_product_dao.insert_stocks(connection, stock_rows)
         
         except KeyError as e:
             raise e
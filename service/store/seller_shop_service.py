@@ -1,4 +1,6 @@
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class SellerShopService:
@@ -44,7 +46,7 @@ class SellerShopService:
             return self.seller_shop_dao.get_seller_info_dao(connection, data)
 
         except KeyError:
-            traceback.print_exc()
+            logger.exception('셀러 정보 조회 key error')
             raise KeyError('key_error')
 
     def get_seller_product_search_service(self, connection, data):
@@ -73,7 +75,7 @@ class SellerShopService:
             return self.seller_shop_dao.get_seller_product_search_dao(connection, data)
 
         except KeyError:
-            traceback.print_exc()
+            logger.exception('셀러 상품 검색 key error')
             raise KeyError('key_error')
 
     def get_seller_category_service(self, connection, data):
@@ -109,7 +111,7 @@ class SellerShopService:
             return self.seller_shop_dao.get_seller_category_dao(connection, data)
 
         except KeyError:
-            traceback.print_exc()
+            logger.exception('셀러 카테고리 조회 key error')
             raise KeyError('key_error')
 
     def get_seller_product_list_service(self, connection, data):
@@ -138,5 +140,5 @@ class SellerShopService:
             return self.seller_shop_dao.get_seller_product_list_dao(connection, data)
 
         except KeyError:
-            traceback.print_exc()
+            logger.exception('셀러 상품 리스트 조회 key error')
             raise KeyError('key_error')
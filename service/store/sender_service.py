@@ -1,6 +1,8 @@
-import traceback
+import logging
 from utils.custom_exceptions import CustomerPermissionDenied
 
+logger = logging.getLogger(__name__)
+
 
 class SenderService:
     """ Business Layer
@@ -32,6 +34,8 @@ class SenderService:
         Raises:
             400, {'message': 'key error',
             'errorMessage': 'key_error'} : 잘못 입력된 키값
+            401, {'message': 'account_does_not_exist',
+            'errorMessage': 'account_does_not_exist'} : 계정 정보 없음
             400, {'message': 'unable to close database',
             'errorMessage': 'unable_to_close_database'} : 커넥션 종료 실패
             403, {'message': 'customer permission denied',
@@ -47,13 +51,22 @@ class SenderService:
             if data['user_permission'] != 3:
                 raise CustomerPermissionDenied('customer_permission_denied')
 
-            #주문 정보 조회
-            return self.sender_dao.get_sender_info_dao(connection, data)
+            # 주문자 정보와 사용자 권한 조회
+            sender_info = self.sender_dao.get_sender_and_permission_dao(connection, data)
+
+            # 데이터베이스에 저장된 사용자 권한 체크
+            if sender_info['permission_type_id'] != 3:
+                raise CustomerPermissionDenied('customer_permission_denied')
+
+            return {
+                'name': sender_info['name'],
+                'phone': sender_info['phone'],
+                'email': sender_info['email']
+            }
 
         except CustomerPermissionDenied as e:
-            traceback.print_exc()
             raise e
 
         except KeyError:
-            traceback.print_exc()
+            logger.exception('주문자 정보 조회 key error')
             raise KeyError('key_error')
@@ -0,0 +1,245 @@
+from unittest import mock, TestCase
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from utils import connection as db
+from utils.custom_exceptions import DatabaseCloseFail
+
+
+class FakeCursor:
+    """ 실행한 쿼리를 기록하는 가짜 cursor """
+
+    def __init__(self):
+        self.queries = []
+        self.closed = False
+
+    def execute(self, query, args=None):
+        self.queries.append(query)
+
+    def executemany(self, query, args):
+        self.queries.append(query)
+
+    def callproc(self, procname, args=()):
+        self.queries.append(procname)
+
+    def fetchall(self):
+        return ()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """ commit, rollback, close 호출을 기록하는 가짜 connection """
+
+    def __init__(self, close_error=None):
+        self.calls = []
+        self.cursors = []
+        self.close_error = close_error
+
+    def cursor(self, *args):
+        cursor = FakeCursor()
+        self.cursors.append(cursor)
+        return cursor
+
+    def begin(self):
+        self.calls.append('begin')
+
+    def commit(self):
+        self.calls.append('commit')
+
+    def rollback(self):
+        self.calls.append('rollback')
+
+    def close(self):
+        self.calls.append('close')
+        if self.close_error:
+            raise self.close_error
+
+
+class TestIsReadOnly(TestCase):
+    """ Test
+
+        Target: utils/connection._is_read_only
+    """
+
+    def test_read_only_verbs(self):
+        """ SELECT, SHOW, DESCRIBE, EXPLAIN 으로 시작하는 쿼리는 읽기 전용 """
+
+        for query in ('SELECT 1', 'select id from products', 'SHOW TABLES', 'DESC products', 'EXPLAIN SELECT 1'):
+            self.assertTrue(db._is_read_only(query), query)
+
+    def test_leading_whitespace(self):
+        """ 쿼리 앞의 공백, 줄바꿈은 무시한다. """
+
+        self.assertTrue(db._is_read_only('\n        SELECT id FROM products;'))
+        self.assertFalse(db._is_read_only('\n        INSERT INTO products (name) VALUES (%s);'))
+
+    def test_locking_read(self):
+        """ 잠금 읽기는 트랜잭션 안에서 실행해야 하므로 읽기 전용이 아니다. """
+
+        self.assertFalse(db._is_read_only(' \n SELECT id FROM orders WHERE id = %s FOR UPDATE;'))
+        self.assertFalse(db._is_read_only('SELECT id FROM orders FOR SHARE'))
+        self.assertFalse(db._is_read_only('SELECT id FROM orders LOCK IN SHARE MODE'))
+
+    def test_write_queries(self):
+        """ 읽기 전용 구문으로 시작하지 않는 쿼리와 빈 쿼리는 읽기 전용이 아니다. """
+
+        for query in ('UPDATE products SET name = %s', 'DELETE FROM carts', 'SET @id = 1', ''):
+            self.assertFalse(db._is_read_only(query), query)
+
+
+class TestTrackedConnection(TestCase):
+    """ Test
+
+        Target: utils/connection._TrackedConnection, _TrackedCursor
+    """
+
+    def setUp(self):
+        self.raw = FakeConnection()
+        self.connection = db._TrackedConnection(self.raw)
+
+    def test_read_does_not_mark_dirty(self):
+        """ 읽기 전용 쿼리만 실행하면 dirty 가 아니고 트랜잭션을 시작하지 않는다. """
+
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+        self.assertFalse(self.connection.dirty)
+        self.assertNotIn('begin', self.raw.calls)
+        self.assertTrue(self.raw.cursors[0].closed)
+
+    def test_write_marks_dirty(self):
+        """ execute, executemany, callproc 로 데이터를 변경하면 dirty 로 표시한다. """
+
+        for method, args in (('execute', ('UPDATE products SET name = %s', ('a',))),
+                             ('executemany', ('INSERT INTO stocks VALUES (%s)', [(1,), (2,)])),
+                             ('callproc', ('refresh_stocks',))):
+            raw = FakeConnection()
+            connection = db._TrackedConnection(raw)
+
+            with connection.cursor() as cursor:
+                getattr(cursor, method)(*args)
+
+            self.assertTrue(connection.dirty, method)
+            self.assertEqual(raw.calls, ['begin'], method)
+
+    def test_begin_once_before_first_write(self):
+        """ 트랜잭션은 데이터를 변경하는 첫 번째 쿼리 전에 한 번만 시작한다. """
+
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.execute('INSERT INTO carts (account_id) VALUES (%s)', (1,))
+            cursor.execute('UPDATE carts SET quantity = %s', (2,))
+
+        self.assertEqual(self.raw.calls, ['begin'])
+
+    def test_commit_and_rollback_reset_dirty(self):
+        """ commit, rollback 후에는 dirty 가 해제된다. """
+
+        for method in ('commit', 'rollback'):
+            with self.connection.cursor() as cursor:
+                cursor.execute('DELETE FROM carts')
+
+            getattr(self.connection, method)()
+
+            self.assertFalse(self.connection.dirty, method)
+
+        self.assertEqual(self.raw.calls, ['begin', 'commit', 'begin', 'rollback'])
+
+    def test_delegates_attributes(self):
+        """ 감싸지 않은 속성은 원래 connection, cursor 의 속성을 반환한다. """
+
+        with self.connection.cursor() as cursor:
+            self.assertEqual(cursor.fetchall(), ())
+            self.assertIs(cursor.queries, self.raw.cursors[0].queries)
+
+        self.assertIs(self.connection.cursors, self.raw.cursors)
+
+
+class TestManagedConnection(TestCase):
+    """ Test
+
+        Target: utils/connection.managed_connection
+    """
+
+    def setUp(self):
+        self.raw = FakeConnection()
+        patcher = mock.patch('utils.connection.get_connection', return_value=self.raw)
+        self.get_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_read_only_block(self):
+        """ 읽기 전용 쿼리만 실행한 경우 commit, rollback 없이 connection 만 반환한다. """
+
+        with db.managed_connection({}) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+
+        self.assertNotIn('commit', self.raw.calls)
+        self.assertNotIn('rollback', self.raw.calls)
+        self.assertEqual(self.raw.calls[-1], 'close')
+
+    def test_commit_after_write(self):
+        """ 데이터를 변경한 경우 블록이 끝나면 commit 후 connection 을 반환한다. """
+
+        with db.managed_connection({}) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute('INSERT INTO carts (account_id) VALUES (%s)', (1,))
+
+        self.assertEqual(self.raw.calls[-2:], ['commit', 'close'])
+        self.assertNotIn('rollback', self.raw.calls)
+
+    def test_rollback_after_write_and_exception(self):
+        """ 데이터를 변경한 뒤 예외가 발생하면 rollback 후 예외를 다시 발생시킨다. """
+
+        with self.assertRaises(ValueError):
+            with db.managed_connection({}) as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute('UPDATE carts SET quantity = %s', (2,))
+                raise ValueError
+
+        self.assertEqual(self.raw.calls[-2:], ['rollback', 'close'])
+        self.assertNotIn('commit', self.raw.calls)
+
+    def test_no_rollback_after_read_and_exception(self):
+        """ 읽기만 한 뒤 예외가 발생하면 rollback 없이 예외를 다시 발생시킨다. """
+
+        with self.assertRaises(ValueError):
+            with db.managed_connection({}) as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                raise ValueError
+
+        self.assertNotIn('commit', self.raw.calls)
+        self.assertNotIn('rollback', self.raw.calls)
+        self.assertEqual(self.raw.calls[-1], 'close')
+
+    def test_close_fail(self):
+        """ connection 반환에 실패하면 DatabaseCloseFail 을 발생시킨다. """
+
+        self.raw.close_error = OSError('close fail')
+
+        with self.assertRaises(DatabaseCloseFail):
+            with db.managed_connection({}):
+                pass
+
+    def test_no_command_for_read_only(self):
+        """ 읽기 전용 블록은 begin, commit, rollback 없이 connection 만 반환한다. """
+
+        for role in ('write', 'read'):
+            with db.managed_connection({}, role=role) as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+
+        self.assertEqual(self.raw.calls, ['close', 'close'])
+
+    def test_role(self):
+        """ role 을 get_connection 에 그대로 전달한다. """
+
+        with db.managed_connection({}, role='read'):
+            pass
+
+        self.get_connection.assert_called_once_with({}, 'read', autocommit=True)
@@ -1,15 +1,217 @@
 """ 데이터베이스 커낵션을 생성해 주는 파일
 
-database 를 인자로 받아 connection 객체를 생성한뒤 반환해준다.
+database 를 인자로 받아 커넥션 풀을 생성한뒤, 풀에서 connection 객체를 꺼내 반환해준다.
+풀은 database 별로 한 번만 생성되며, connection.close() 는 실제 연결을 끊지 않고 풀에 반환한다.
+
+기본적인 사용 예시:
+    with managed_connection(self.database) as connection:
+        result = self.service.xxx(connection, data)
+
+읽기 전용 쿼리만 실행하는 경우 role='read' 로 replica 커넥션을 사용할 수 있다.
+replica 는 app.config['DB']['replica'] 에 설정하며, 설정하지 않은 값은 primary 의 값을 사용한다.
+replica 가 설정되어 있지 않으면 primary 커넥션을 반환한다.
+replica 에는 복제 지연이 있으므로, 사용자가 방금 변경한 데이터를 조회하거나 조회 결과를 캐시하는 경우에는 사용하지 않는다.
+    with managed_connection(self.database, role='read') as connection:
+        result = self.service.xxx(connection, data)
 
 """
-import pymysql
+import os
+import re
+import threading
+
+from contextlib import contextmanager
+
+import MySQLdb
+
+from dbutils.pooled_db import PooledDB
+
+from utils.custom_exceptions import DatabaseCloseFail
+
+# 풀의 최대 연결 수 (vCPU 당 4개)
+POOL_MAX_CONNECTIONS = 4 * (os.cpu_count() or 1)
+
+# mysql_set_server_option() 의 multi-statement 해제 옵션 값 (enum_mysql_set_option)
+_MYSQL_OPTION_MULTI_STATEMENTS_OFF = 1
+
+# 데이터를 변경하지 않는 쿼리의 시작 구문
+_READ_ONLY_VERBS = ('SELECT', 'SHOW', 'DESCRIBE', 'DESC', 'EXPLAIN')
+
+# 트랜잭션 안에서 실행해야 하는 잠금 읽기 구문
+_LOCKING_READ = re.compile(r'\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b', re.IGNORECASE)
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class _NoFailover(Exception):
+    """ PooledDB 의 failures 로 사용하는, 발생하지 않는 예외
+
+        DBUtils 는 failures 에 해당하는 예외가 발생하면 트랜잭션을 시작하지 않은 connection 에서
+        새 연결로 쿼리를 다시 실행한다. 이 경우 이미 실행된 쿼리는 끊긴 연결과 함께 rollback 되고
+        실패한 쿼리부터 다시 실행되므로, 어떤 예외도 재시도하지 않도록 한다.
+        끊어진 연결은 풀에서 꺼낼 때 ping 으로 확인해 다시 연결한다.
+    """
 
 
-def get_connection(database):
-    connection = pymysql.connect(host=database['host'],
-                                 user=database['user'],
-                                 password=database['password'],
-                                 db=database['name'],
-                                 charset=database['charset'])
+def _connect(*args, **kwargs):
+    """ multi-statement 실행을 끈 MySQLdb connection 생성
+
+        mysqlclient 는 항상 CLIENT.MULTI_STATEMENTS 를 켜고 연결하므로, 연결 직후 서버 옵션으로 끈다.
+        SQL injection 이 발생해도 추가 구문이 실행되지 않도록 하기 위함이다.
+    """
+    connection = MySQLdb.connect(*args, **kwargs)
+    connection.set_server_option(_MYSQL_OPTION_MULTI_STATEMENTS_OFF)
+    return connection
+
+
+def get_pool(database, autocommit=False):
+    """ database 에 해당하는 커넥션 풀 반환
+
+        최초 호출 시 풀을 생성하고, 이후에는 생성된 풀을 재사용한다.
+        autocommit 이 꺼진 풀은 반환된 connection 을 항상 rollback 하고(reset=True),
+        autocommit 이 켜진 풀은 begin() 으로 시작한 트랜잭션이 남아있는 경우에만 rollback 한다.
+
+        Args:
+            database  : app.config['DB']에 담겨있는 정보(데이터베이스 관련 정보)
+            autocommit: connection 의 autocommit 여부
+
+        Returns:
+            PooledDB 객체
+    """
+    key = (database['host'], database['user'], database['name'], autocommit)
+    pool = _pools.get(key)
+
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+
+            if pool is None:
+                pool = PooledDB(creator=_connect,
+                                maxconnections=POOL_MAX_CONNECTIONS,
+                                blocking=True,
+                                reset=not autocommit,
+                                failures=_NoFailover,
+                                host=database['host'],
+                                user=database['user'],
+                                passwd=database['password'],
+                                db=database['name'],
+                                charset=database['charset'],
+                                autocommit=autocommit)
+                _pools[key] = pool
+
+    return pool
+
+
+def get_connection(database, role='write', autocommit=False):
+    if role == 'read' and database.get('replica'):
+        database = {**database, **database['replica']}
+
+    connection = get_pool(database, autocommit).connection()
     return connection
+
+
+def _is_read_only(query):
+    words = query.split(None, 1)
+    return bool(words) and words[0].upper() in _READ_ONLY_VERBS and not _LOCKING_READ.search(query)
+
+
+class _TrackedCursor:
+    """ 데이터를 변경하는 쿼리를 실행하기 전에 connection 의 트랜잭션을 시작하는 cursor proxy """
+
+    def __init__(self, connection, cursor):
+        self._connection = connection
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def execute(self, query, args=None):
+        if not _is_read_only(query):
+            self._connection.begin_write()
+        return self._cursor.execute(query, args)
+
+    def executemany(self, query, args):
+        if not _is_read_only(query):
+            self._connection.begin_write()
+        return self._cursor.executemany(query, args)
+
+    def callproc(self, procname, args=()):
+        self._connection.begin_write()
+        return self._cursor.callproc(procname, args)
+
+
+class _TrackedConnection:
+    """ 데이터를 변경하는 쿼리의 실행 여부(dirty)를 기록하는 connection proxy
+
+        SELECT, SHOW 등 읽기 전용 구문으로 시작하지 않는 쿼리와 잠금 읽기(FOR UPDATE 등)는
+        모두 데이터를 변경하는 쿼리로 보고, 첫 번째 쿼리 전에 트랜잭션을 시작한다.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.dirty = False
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def cursor(self, *args, **kwargs):
+        return _TrackedCursor(self, self._connection.cursor(*args, **kwargs))
+
+    def begin_write(self):
+        if not self.dirty:
+            self._connection.begin()
+            self.dirty = True
+
+    def commit(self):
+        self._connection.commit()
+        self.dirty = False
+
+    def rollback(self):
+        self._connection.rollback()
+        self.dirty = False
+
+
+@contextmanager
+def managed_connection(database, role='write'):
+    """ 풀에서 꺼낸 connection 의 commit, rollback, close 를 처리하는 context manager
+
+        with 블록이 정상 종료되면 commit, 예외가 발생하면 rollback 후 예외를 다시 발생시킨다.
+        데이터를 변경하는 쿼리를 실행하지 않은 경우에는 commit, rollback 을 하지 않는다.
+        어느 경우든 마지막에 connection 을 풀에 반환한다.
+
+        Args:
+            database: app.config['DB']에 담겨있는 정보(데이터베이스 관련 정보)
+            role    : 'write' 이면 primary, 'read' 이면 replica 커넥션을 사용한다.
+
+        Raises:
+            500, {'message': 'database_close_fail',
+            'errorMessage': 'database close fail'} : 커넥션 종료 실패
+
+        Notes:
+            autocommit 이 켜진 connection 을 사용하므로 읽기 전용 쿼리는 트랜잭션 없이 실행되고,
+            데이터를 변경하는 첫 번째 쿼리 전에 begin() 으로 트랜잭션을 시작한다.
+            읽기만 한 경우에는 끝낼 트랜잭션이 없으므로 commit, rollback 없이 풀에 반환한다.
+    """
+    connection = _TrackedConnection(get_connection(database, role, autocommit=True))
+
+    try:
+        yield connection
+        if connection.dirty:
+            connection.commit()
+
+    except Exception:
+        if connection.dirty:
+            connection.rollback()
+        raise
+
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            raise DatabaseCloseFail('database close fail')
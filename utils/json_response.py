@@ -0,0 +1,66 @@
+""" orjson 을 사용하는 JSON 응답
+
+Flask 1.1 의 jsonify 는 표준 json 모듈로 직렬화하므로, 응답 직렬화에는 orjson 을 사용한다.
+직렬화 규칙(Decimal -> float, datetime -> 'YYYY-MM-DD hh:mm:ss')은 app.CustomJSONEncoder 와 같다.
+
+기본적인 사용 예시:
+    app = ORJSONFlask(__name__)
+
+    def get(self):
+        ...
+        return {'message': 'success', 'result': result}
+"""
+
+import datetime
+import decimal
+
+import orjson
+
+from flask import Flask
+
+_ORJSON_OPTION = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(obj):
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat(sep=' ')
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    try:
+        return list(obj)
+    except TypeError:
+        raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+def dumps(obj):
+    """ obj 를 JSON bytes 로 직렬화
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        b'{"message":"success"}'
+    """
+    return orjson.dumps(obj, default=_default, option=_ORJSON_OPTION)
+
+
+class ORJSONFlask(Flask):
+    """ view 가 반환한 dict 를 orjson 으로 직렬화하는 Flask
+
+    dict, (dict, status), (dict, status, headers) 형태의 반환값만 처리하고
+    나머지는 Flask.make_response 에 그대로 넘긴다.
+    """
+
+    def make_response(self, rv):
+        if isinstance(rv, dict):
+            rv = self._json_response(rv)
+
+        elif isinstance(rv, tuple) and rv and isinstance(rv[0], dict):
+            rv = (self._json_response(rv[0]),) + rv[1:]
+
+        return super().make_response(rv)
+
+    def _json_response(self, obj):
+        return self.response_class(dumps(obj), mimetype=self.config['JSONIFY_MIMETYPE'])
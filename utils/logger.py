@@ -0,0 +1,67 @@
+""" 로그 설정
+
+요청을 처리하는 스레드에서 로그 포맷팅(traceback 포함)과 stderr 출력이 일어나지 않도록
+QueueHandler 로 로그 레코드를 큐에 넣고, QueueListener 스레드에서 포맷팅 후 출력한다.
+
+기본적인 사용 예시:
+    logger = logging.getLogger(__name__)
+
+    try:
+        ...
+    except Exception:
+        logger.exception('에러 메세지')
+        raise ServerError('server_error')
+"""
+
+import atexit
+import logging
+import queue
+
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+
+
+class DeferredQueueHandler(QueueHandler):
+    """ 로그 레코드를 포맷팅 하지 않고 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler.prepare() 는 호출한 스레드에서 메세지와 traceback 을 포맷팅 하므로,
+    같은 프로세스 내의 큐만 사용하는 경우 포맷팅을 QueueListener 스레드로 미룬다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def set_queue_logging(level=logging.INFO):
+    """ root 로거에 QueueHandler 를 등록하고 QueueListener 를 시작한다.
+
+    여러 번 호출해도 리스너는 한 번만 생성된다.
+
+    Args:
+        level: root 로거의 로그 레벨
+
+    Returns:
+        QueueListener 객체
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('[%(asctime)s] %(levelname)s in %(name)s: %(message)s')
+    )
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(DeferredQueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return _listener
@@ -12,10 +12,10 @@ from flask_request_validator import AbstractRule
 
 
 class NumberRule(AbstractRule):
+    _PATTERN = re.compile(r'^[0-9]+$')
+
     def validate(self, value):
-        pattern = '^[0-9]+$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('오직 숫자만 받는다.')
@@ -23,10 +23,10 @@ class NumberRule(AbstractRule):
 
 
 class AlphabeticRule(AbstractRule):
+    _PATTERN = re.compile(r'^[A-Za-z]+$')
+
     def validate(self, value):
-        pattern = '^[A-Za-z]+$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('accept only alphabetic characters')
@@ -43,10 +43,10 @@ class GenderRule(AbstractRule):
 
 
 class SellerInfoRule(AbstractRule):
+    _PATTERN = re.compile(r'^[0-9]+$')
+
     def validate(self, value):
-        pattern = '^[0-9]+$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('accept only number')
@@ -54,10 +54,10 @@ class SellerInfoRule(AbstractRule):
 
 
 class DefaultRule(AbstractRule):
+    _PATTERN = re.compile(r'^[a-zA-Z가-힝0-9+-_.]+$')
+
     def validate(self, value):
-        pattern = '^[a-zA-Z가-힝0-9+-_.]+$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('accept only number, text')
@@ -75,10 +75,10 @@ class UsernameRule(AbstractRule):
         2020-12-28(김민구): 초기생성
     """
 
+    _PATTERN = re.compile(r'^[a-zA-Z0-9]{6,20}$')
+
     def validate(self, value):
-        pattern = '^[a-zA-Z0-9]{6,20}$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('please_enter_6-20_letters_or_numbers')
@@ -94,10 +94,10 @@ class PhoneRule(AbstractRule):
     History:
         2020-12-28(김기용): 초기생성
     """
+    _PATTERN = re.compile(r'^[0-9]{10,11}$')
+
     def validate(self, value):
-        pattern = '^[0-9]{10,11}$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('accept only 10~11 digit numbers')
@@ -115,10 +115,10 @@ class PasswordRule(AbstractRule):
         2020-12-28(김민구): 초기생성
     """
 
+    _PATTERN = re.compile(r'^.*(?=.{8,20})(?=.*[a-zA-Z])(?=.*?[A-Z])(?=.*\d)(?=.*[!@#£$%^&*()_+={}\-?:~\[\]])[a-zA-Z0-9!@#£$%^&*()_+={}\-?:~\[\]]+$')
+
     def validate(self, value):
-        pattern = '^.*(?=.{8,20})(?=.*[a-zA-Z])(?=.*?[A-Z])(?=.*\d)(?=.*[!@#£$%^&*()_+={}\-?:~\[\]])[a-zA-Z0-9!@#£$%^&*()_+={}\-?:~\[\]]+$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('8~20_characters_including_numbers_uppercase_letters_lowercase_letters_special_characters')
@@ -132,10 +132,10 @@ class PostalCodeRule(AbstractRule):
     History:
         2020-12-28(김기용): 초기생성
     """
+    _PATTERN = re.compile(r'^[0-9]{8}$')
+
     def validate(self, value):
-        pattern = '^[0-9]{8}$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('accept only 8 digit numbers')
@@ -155,10 +155,10 @@ class EmailRule(AbstractRule):
         2020-12-28(김민구): 초기생성
     """
 
+    _PATTERN = re.compile(r'^[a-zA-Z0-9-_]+@[a-zA-Z0-9]+\.[a-zA-Z0-9]+$')
+
     def validate(self, value):
-        pattern = '^[a-zA-Z0-9-_]+@[a-zA-Z0-9]+\.[a-zA-Z0-9]+$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('this_email_is_incorrect')
@@ -166,10 +166,10 @@ class EmailRule(AbstractRule):
 
 
 class DecimalRule(AbstractRule):
+    _PATTERN = re.compile(r'^\d*\.?\d*$')
+
     def validate(self, value):
-        pattern = '^\d*\.?\d*$'
-        regex = re.compile(pattern)
-        result = regex.match(value)
+        result = self._PATTERN.fullmatch(value)
         errors = []
         if not result:
             errors.append('accept only decimal value')
@@ -234,11 +234,11 @@ class DateRule(AbstractRule):
         History:
             2020-12-29(강두연): 날짜 형식 벨리데이터 역할 규칙 작성
     """
+    _PATTERN = re.compile(r'^([12]\d{3}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01]))$')
+
     def validate(self, value):
-        pattern = '^([12]\\d{3}-(0[1-9]|1[0-2])-(0[1-9]|[12]\\d|3[01]))$'
-        regex = re.compile(pattern)
         errors = []
-        if not regex.match(value):
+        if not self._PATTERN.fullmatch(value):
             errors.append('date format should be YYYY-MM-DD')
         return value, errors
 
@@ -358,11 +358,11 @@ class SecondDateTimeRule(AbstractRule):
         History:
             2020-12-29(김민서): 날짜 시간 형식 벨리데이터 역할 규칙 작성
     """
+    _PATTERN = re.compile(r'^([0-9]{4}-[0-9]{2}-[0-9]{2}\s[0-9]{2}:[0-9]{2}:[0-9]{2})$')
+
     def validate(self, value):
-        pattern = '^([0-9]{4}-[0-9]{2}-[0-9]{2}\s[0-9]{2}:[0-9]{2}:[0-9]{2})$'
-        regex = re.compile(pattern)
         errors = []
-        if not regex.match(value):
+        if not self._PATTERN.fullmatch(value):
             errors.append('datetime must be "YYYY-MM-DD HH:MM:SS"')
         return value, errors
 
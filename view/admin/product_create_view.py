@@ -4,7 +4,7 @@ from flask                          import jsonify, request, json, g
 from flask.views                    import MethodView
 from flask_request_validator.rules  import NotEmpty
 
-from utils.connection               import get_connection
+from utils.connection               import get_connection, managed_connection
 from utils.decorator                import signin_decorator
 from utils.custom_exceptions        import DatabaseCloseFail
 from utils.rules                    import NumberRule
@@ -298,9 +298,6 @@ class CreateProductView(MethodView):
                 500, {'message': 'product code update denied',
                       'errorMessage': 'unable_to_update_product_code'}                        : 상품 코드 갱신 실패
                 
-                500, {'message': 'product code update denied',
-                      'errorMessage': 'unable_to_update_product_code'}                        : 상품 코드 갱신 실패
-                
                 500, {'message': 'product image create denied',
                       'errorMessage': 'unable_to_create_product_image'}                       : 상품 이미지 등록 실패
                 
@@ -330,43 +327,40 @@ class CreateProductView(MethodView):
                                    -북마크 테이블 초기 등록 처리 추가.
         """
         
-        try:
-            data = {
-                'seller_id'              : request.form.get('seller_id'),
-                'account_id'             : g.account_id,
-                'is_sale'                : request.form.get('is_sale'),
-                'is_display'             : request.form.get('is_display'),
-                'main_category_id'       : request.form.get('main_category_id'),
-                'sub_category_id'        : request.form.get('sub_category_id'),
-                'is_product_notice'      : request.form.get('is_product_notice'),
-                'manufacturer'           : request.form.get('manufacturer', None),
-                'manufacturing_date'     : request.form.get('manufacturing_date', None),
-                'product_origin_type_id' : request.form.get('product_origin_type_id', None),
-                'product_name'           : request.form.get('product_name'),
-                'description'            : request.form.get('description'),
-                'detail_information'     : request.form.get('detail_information'),
-                'minimum_quantity'       : request.form.get('minimum_quantity'),
-                'maximum_quantity'       : request.form.get('maximum_quantity'),
-                'origin_price'           : request.form.get('origin_price'),
-                'discount_rate'          : request.form.get('discount_rate'),
-                'discounted_price'       : request.form.get('discounted_price'),
-                'discount_start_date'    : request.form.get('discount_start_date', None),
-                'discount_end_date'      : request.form.get('discount_end_date', None)
-            }
-            
-            product_images = request.files.getlist("image_files")
-            stocks         = json.loads(request.form.get('options'))
-            connection     = get_connection(self.database)
-            
-            product_id = self.service.create_product_service(
+        data = {
+            'seller_id'              : request.form.get('seller_id'),
+            'account_id'             : g.account_id,
+            'is_sale'                : request.form.get('is_sale'),
+            'is_display'             : request.form.get('is_display'),
+            'main_category_id'       : request.form.get('main_category_id'),
+            'sub_category_id'        : request.form.get('sub_category_id'),
+            'is_product_notice'      : request.form.get('is_product_notice'),
+            'manufacturer'           : request.form.get('manufacturer', None),
+            'manufacturing_date'     : request.form.get('manufacturing_date', None),
+            'product_origin_type_id' : request.form.get('product_origin_type_id', None),
+            'product_name'           : request.form.get('product_name'),
+            'description'            : request.form.get('description'),
+            'detail_information'     : request.form.get('detail_information'),
+            'minimum_quantity'       : request.form.get('minimum_quantity'),
+            'maximum_quantity'       : request.form.get('maximum_quantity'),
+            'origin_price'           : request.form.get('origin_price'),
+            'discount_rate'          : request.form.get('discount_rate'),
+            'discounted_price'       : request.form.get('discounted_price'),
+            'discount_start_date'    : request.form.get('discount_start_date', None),
+            'discount_end_date'      : request.form.get('discount_end_date', None)
+        }
+        
+        product_images = request.files.getlist("image_files")
+        stocks         = json.loads(request.form.get('options'))
+        
+        with managed_connection(self.database) as connection:
+            product = self.service.create_product_service(
                 connection,
                 data
             )
             
-            product_code = self.service.update_product_code_service(
-                connection,
-                product_id
-            )
+            product_id   = product['product_id']
+            product_code = product['product_code']
             
             self.service.create_stock_service(
                 connection,
@@ -374,12 +368,6 @@ class CreateProductView(MethodView):
                 stocks
             )
             
-            self.service.create_product_history_service(
-                connection,
-                product_id,
-                data
-            )
-            
             self.service.create_product_sales_volumes_service(
                 connection,
                 product_id
@@ -397,25 +385,5 @@ class CreateProductView(MethodView):
                 product_code,
                 product_images
             )
-            
-            connection.commit()
-            
-            return jsonify({'message': 'success'}), 200
-            
-        except KeyError as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
-            
-        except Exception as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
         
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                traceback.print_exc()
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success'}), 200
@@ -1,4 +1,3 @@
-from flask import jsonify
 from flask.views import MethodView
 from flask_request_validator import (
     GET,
@@ -9,7 +8,7 @@ from flask_request_validator import (
 )
 
 from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from utils.custom_exceptions import DatabaseCloseFail, SellerNotExist
 from utils.decorator import signin_decorator
 
 
@@ -72,9 +71,21 @@ class SellerShopView(MethodView):
         account_id = args[0]
 
         try:
-            connection = get_connection(self.database)
-            seller_info = self.service.get_seller_info_service(connection, account_id)
-            return jsonify({'message': 'success', 'result': seller_info})
+            connection = get_connection(self.database, role='read')
+
+            try:
+                seller_info = self.service.get_seller_info_service(connection, account_id)
+
+            # replica 에 아직 반영되지 않은 셀러일 수 있으므로 primary 에서 다시 조회한다.
+            except SellerNotExist:
+                if not self.database.get('replica'):
+                    raise
+
+                connection.close()
+                connection = get_connection(self.database)
+                seller_info = self.service.get_seller_info_service(connection, account_id)
+
+            return {'message': 'success', 'result': seller_info}
 
         except Exception as e:
             raise e
@@ -164,9 +175,9 @@ class SellerShopSearchView(MethodView):
         }
 
         try:
-            connection = get_connection(self.database)
+            connection = get_connection(self.database, role='read')
             search_product_list = self.service.get_seller_product_search_service(connection, data)
-            return jsonify({'message': 'success', 'result': search_product_list})
+            return {'message': 'success', 'result': search_product_list}
 
         except Exception as e:
             raise e
@@ -239,9 +250,9 @@ class SellerShopCategoryView(MethodView):
         }
 
         try:
-            connection = get_connection(self.database)
+            connection = get_connection(self.database, role='read')
             category_list = self.service.get_seller_category_service(connection, data)
-            return jsonify({'message': 'success', 'result': category_list})
+            return {'message': 'success', 'result': category_list}
 
         except Exception as e:
             raise e
@@ -334,9 +345,9 @@ class SellerShopProductListView(MethodView):
         }
 
         try:
-            connection = get_connection(self.database)
+            connection = get_connection(self.database, role='read')
             product_list = self.service.get_seller_product_list_service(connection, data)
-            return jsonify({'message': 'success', 'result': product_list})
+            return {'message': 'success', 'result': product_list}
 
         except Exception as e:
             raise e
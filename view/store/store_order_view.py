@@ -1,4 +1,4 @@
-from flask import jsonify, g
+from flask import g
 from flask.views import MethodView
 from flask_request_validator import (
     PATH,
@@ -7,8 +7,8 @@ from flask_request_validator import (
     validate_params
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from model.store.sender_dao import delete_sender_info_cache
+from utils.connection import managed_connection
 from utils.rules import DecimalRule, EmailRule, PostalCodeRule, PhoneRule
 from utils.decorator import signin_decorator
 
@@ -75,19 +75,9 @@ class StoreOrderView(MethodView):
             "user_permission": g.permission_type_id
         }
         
-        try:
-            connection = get_connection(self.database)
+        with managed_connection(self.database) as connection:
             store_order_info = self.service.get_store_order_service(connection, data)
-            return jsonify({'message': 'success', 'result': store_order_info})
-
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+            return {'message': 'success', 'result': store_order_info}
 
 
 class StoreOrderAddView(MethodView):
@@ -177,44 +167,55 @@ class StoreOrderAddView(MethodView):
         History:
             2020-12-30(고수희): 초기 생성
         """
+        (
+            cart_id,
+            product_id,
+            stock_id,
+            quantity,
+            original_price,
+            sale,
+            discounted_price,
+            total_price,
+            sold_out,
+            sender_name,
+            sender_phone,
+            sender_email,
+            recipient_name,
+            recipient_phone,
+            address1,
+            address2,
+            post_number,
+            delivery_memo_type_id,
+            delivery_content,
+        ) = args
+
         data = {
             'user_id': g.account_id,
             'user_permission': g.permission_type_id,
-            'cart_id': args[0],
-            'product_id': args[1],
-            'stock_id': args[2],
-            'quantity': args[3],
-            'original_price': args[4],
-            'sale': args[5],
-            'discounted_price': args[6],
-            'total_price': args[7],
-            'sold_out': args[8],
-            'sender_name': args[9],
-            'sender_phone': args[10],
-            'sender_email': args[11],
-            'recipient_name': args[12],
-            'recipient_phone': args[13],
-            'address1': args[14],
-            'address2': args[15],
-            'post_number': args[16],
-            'delivery_memo_type_id': args[17],
-            'delivery_content': args[18],
+            'cart_id': cart_id,
+            'product_id': product_id,
+            'stock_id': stock_id,
+            'quantity': quantity,
+            'original_price': original_price,
+            'sale': sale,
+            'discounted_price': discounted_price,
+            'total_price': total_price,
+            'sold_out': sold_out,
+            'sender_name': sender_name,
+            'sender_phone': sender_phone,
+            'sender_email': sender_email,
+            'recipient_name': recipient_name,
+            'recipient_phone': recipient_phone,
+            'address1': address1,
+            'address2': address2,
+            'post_number': post_number,
+            'delivery_memo_type_id': delivery_memo_type_id,
+            'delivery_content': delivery_content,
         }
 
-        try:
-            connection = get_connection(self.database)
+        with managed_connection(self.database) as connection:
             order_id = self.service.post_order_service(connection, data)
-            connection.commit()
-            return {'message': 'success', 'result': {"order_id": order_id}}, 201
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
 
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        # 주문자 정보가 변경되었으므로 커밋 이후 캐시된 주문자 정보 무효화
+        delete_sender_info_cache(data['user_id'])
+        return {'message': 'success', 'result': {"order_id": order_id}}, 201